@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-08-27 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("receipts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="receipt",
+            index=models.Index(fields=["-created_at"], name="receipt_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["-created_at"], name="job_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("status__in", ["PENDING", "RUNNING"])),
+                fields=["status"],
+                name="job_active_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Q
+from postgres_copy import CopyManager
 
 class Merchant(models.Model):
     name = models.CharField(max_length=255)
@@ -26,6 +28,11 @@ class Receipt(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # List views order by -created_at; the index turns ORDER BY + LIMIT
+        # into an index scan instead of a seq scan + sort.
+        indexes = [models.Index(fields=["-created_at"], name="receipt_created_idx")]
+
 
 class ReceiptItem(models.Model):
     receipt = models.ForeignKey(Receipt, related_name="items", on_delete=models.CASCADE)
@@ -34,6 +41,11 @@ class ReceiptItem(models.Model):
     unit_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
 
+    objects = models.Manager()
+    # COPY FROM STDIN path for backfills/reprocessing: bulk_create tops out on
+    # per-row parse/bind overhead, ReceiptItem.copies.from_csv(...) does not.
+    copies = CopyManager()
+
 
 class Job(models.Model):
     PENDING, RUNNING, SUCCEEDED, FAILED = "PENDING","RUNNING","SUCCEEDED","FAILED"
@@ -46,3 +58,12 @@ class Job(models.Model):
     finished_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at"], name="job_created_idx"),
+            # Partial index: worker/status dashboards only ever scan jobs
+            # that are still in flight.
+            models.Index(fields=["status"], condition=Q(status__in=["PENDING", "RUNNING"]),
+                         name="job_active_idx"),
+        ]
+
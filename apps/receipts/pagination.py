@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination over created_at.
+
+    LIMIT/OFFSET degrades linearly with page depth because Postgres must
+    scan and discard the skipped rows; a cursor on the indexed created_at
+    column is an index seek regardless of how deep the client pages.
+    """
+
+    page_size = 50
+    ordering = "-created_at"
+    cursor_query_param = "cursor"
@@ -1,5 +1,14 @@
+from django.utils import timezone
 from rest_framework import serializers
 from .models import Receipt, Merchant, Category, ReceiptItem, Job
+
+def _iso(dt):
+    # Mirror DRF's DateTimeField: localize aware values to the current
+    # timezone before formatting, with the same Z shorthand for UTC.
+    if dt is None: return None
+    if timezone.is_aware(dt): dt = timezone.localtime(dt)
+    value = dt.isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
 class MerchantSerializer(serializers.ModelSerializer):
     class Meta: model = Merchant; fields = ("id","name","abn","address","normalized_name")
 class CategorySerializer(serializers.ModelSerializer):
@@ -12,5 +21,39 @@ class ReceiptSerializer(serializers.ModelSerializer):
     class Meta:
         model = Receipt
         fields = ("id","uuid","total","currency","purchased_at","merchant","category","image_uri","raw_json","items","created_at","updated_at")
+    _include_raw_json = True
+    def to_representation(self, instance):
+        # Hand-rolled dict builder for the read path: skips DRF's per-field
+        # getattr/dispatch loop, which dominates CPU on large list pages.
+        # Keep the keys in sync with Meta.fields above.
+        merchant = instance.merchant; category = instance.category
+        data = {
+            "id": instance.id,
+            "uuid": instance.uuid,
+            "total": str(instance.total),
+            "currency": instance.currency,
+            "purchased_at": _iso(instance.purchased_at),
+            "merchant": {"id": merchant.id, "name": merchant.name, "abn": merchant.abn,
+                         "address": merchant.address, "normalized_name": merchant.normalized_name},
+            "category": ({"id": category.id, "name": category.name, "parent": category.parent_id}
+                         if category is not None else None),
+            "image_uri": instance.image_uri,
+            "items": [{"id": it.id, "line_text": it.line_text, "quantity": it.quantity,
+                       "unit_price": str(it.unit_price) if it.unit_price is not None else None,
+                       "amount": str(it.amount) if it.amount is not None else None}
+                      for it in instance.items.all()],
+            "created_at": _iso(instance.created_at),
+            "updated_at": _iso(instance.updated_at),
+        }
+        if self._include_raw_json:
+            data["raw_json"] = instance.raw_json
+        return data
+
+class ReceiptListSerializer(ReceiptSerializer):
+    # List pages drop raw_json (the full LLM payload, KBs per row); the view
+    # defers the column so it never leaves the database. Detail keeps it.
+    _include_raw_json = False
+    class Meta(ReceiptSerializer.Meta):
+        fields = tuple(f for f in ReceiptSerializer.Meta.fields if f != "raw_json")
 class JobSerializer(serializers.ModelSerializer):
     class Meta: model = Job; fields = ("id","idempotency_key","receipt","status","error","started_at","finished_at","created_at")
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ..models import Merchant
+
+
+@lru_cache(maxsize=4096)
+def get_or_create_merchant_id(name: str, abn: str = "", address: str = "") -> int:
+    """Resolve a merchant to its row id, creating it on first sight.
+
+    Batch uploads tend to repeat the same store, so the hot lookup is served
+    from this in-process cache instead of one get_or_create roundtrip per
+    receipt. abn/address are creation defaults only, matching the lookup the
+    ingest task always did by name. Cleared automatically on worker recycle.
+    """
+    merchant, _ = Merchant.objects.get_or_create(
+        name=name,
+        defaults={"abn": abn, "address": address, "normalized_name": name.lower()},
+    )
+    return merchant.id
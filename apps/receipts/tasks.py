@@ -1,9 +1,10 @@
 from celery import shared_task
 from django.utils import timezone
 from django.db import transaction
-from .models import Job, Receipt, Merchant, Category, ReceiptItem
-from .services.llm_adapter import LLMAdapter
+from .models import Job, Receipt, Category, ReceiptItem
+from .services.llm_adapter import get_llm_adapter
 from .services.embedding import EmbeddingIndex
+from .services.merchants import get_or_create_merchant_id
 
 @shared_task
 def process_receipt_job(job_id: int, image_uri: str):
@@ -11,27 +12,29 @@ def process_receipt_job(job_id: int, image_uri: str):
     job.status = Job.RUNNING; job.started_at = timezone.now()
     job.save(update_fields=["status","started_at"])
     try:
-        adapter = LLMAdapter(); 
+        adapter = get_llm_adapter()
         result = adapter.parse_receipt(image_uri)
+        merchant_name = result.merchant.get("name","Unknown")
+        # Resolved outside the transaction so the cache never retains an id
+        # from a rolled-back insert.
+        merchant_id = get_or_create_merchant_id(
+            merchant_name, result.merchant.get("abn",""), result.merchant.get("address",""),
+        )
         with transaction.atomic():
-            merchant, _ = Merchant.objects.get_or_create(
-                name=result.merchant.get("name","Unknown"),
-                defaults={"abn":result.merchant.get("abn",""),"address":result.merchant.get("address",""),
-                          "normalized_name":result.merchant.get("name","").lower()},
-            )
             category = None
             if result.category: 
                 category, _ = Category.objects.get_or_create(name=result.category)
             receipt = Receipt.objects.create(
                 uuid=result.uuid,total=result.total,currency=result.currency,purchased_at=result.purchased_at,
-                merchant=merchant,category=category,image_uri=image_uri,raw_json=result.raw_json,
+                merchant_id=merchant_id,category=category,image_uri=image_uri,raw_json=result.raw_json,
+            )
+            ReceiptItem.objects.bulk_create(
+                [ReceiptItem(receipt=receipt,line_text=item.get("line_text",""),quantity=item.get("quantity"),
+                             unit_price=item.get("unit_price"),amount=item.get("amount"))
+                 for item in result.items],
+                batch_size=500,
             )
-            for item in result.items:
-                ReceiptItem.objects.create(
-                    receipt=receipt,line_text=item.get("line_text",""),quantity=item.get("quantity"),
-                    unit_price=item.get("unit_price"),amount=item.get("amount"),
-                )
-        EmbeddingIndex().upsert_receipt(receipt.id, [merchant.name])
+        EmbeddingIndex().upsert_receipt(receipt.id, [merchant_name])
         job.receipt = receipt; job.status = Job.SUCCEEDED; job.finished_at = timezone.now()
         job.save(update_fields=["receipt","status","finished_at"])
     except Exception as e:
@@ -3,18 +3,35 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils.crypto import get_random_string
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from .models import Receipt, Job
-from .serializers import ReceiptSerializer, JobSerializer
+from .serializers import ReceiptSerializer, ReceiptListSerializer, JobSerializer
 from .tasks import process_receipt_job
 
   
 class ReceiptViewSet(ReadOnlyModelViewSet):
-    queryset = Receipt.objects.all().order_by("-created_at")
+    # select_related/prefetch_related keep the nested merchant/category/items
+    # serializers at a constant number of queries per page instead of 1 + 3N.
+    queryset = (
+        Receipt.objects.select_related("merchant", "category")
+        .prefetch_related("items")
+        .order_by("-created_at")
+    )
     serializer_class = ReceiptSerializer
 
+    def get_serializer_class(self):
+        return ReceiptListSerializer if self.action == "list" else ReceiptSerializer
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        # raw_json can be KBs of LLM payload per row; keep it out of list
+        # queries entirely and only fetch it on retrieve.
+        return qs.defer("raw_json") if self.action == "list" else qs
+
 class JobViewSet(ReadOnlyModelViewSet):
-    queryset = Job.objects.all().order_by("-created_at")
+    # No select_related here: JobSerializer renders receipt as a pk, which
+    # DRF serves from receipt_id without touching the Receipt table.
+    queryset = Job.objects.order_by("-created_at")
     serializer_class = JobSerializer
 
 #---------------------------------------------------------------
@@ -27,10 +44,20 @@ class IngestReceiptView(APIView):
     def post(self, request):
         image_uri = request.data.get("image_uri")
         idem = request.headers.get("Idempotency-Key") or get_random_string(24)
-        if not image_uri: 
+        if not image_uri:
             return Response({"detail":"image_uri required"}, status=status.HTTP_400_BAD_REQUEST)
-        with transaction.atomic():
-            job, created = Job.objects.get_or_create(idempotency_key=idem)
-            if not created: return Response(JobSerializer(job).data, status=status.HTTP_200_OK)
-            process_receipt_job.delay(job.id, image_uri)
-            return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+        # Idempotent-hit fast path: a plain indexed lookup, no transaction or
+        # row lock needed just to echo an existing job back.
+        existing = Job.objects.filter(idempotency_key=idem).first()
+        if existing:
+            return Response(JobSerializer(existing).data, status=status.HTTP_200_OK)
+        try:
+            with transaction.atomic():
+                job = Job.objects.create(idempotency_key=idem)
+                process_receipt_job.delay(job.id, image_uri)
+        except IntegrityError:
+            # Lost a race with a concurrent retry of the same key; the other
+            # request owns the job.
+            job = Job.objects.get(idempotency_key=idem)
+            return Response(JobSerializer(job).data, status=status.HTTP_200_OK)
+        return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
@@ -3,5 +3,15 @@ from celery import Celery
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pennywise_api.settings")
 app = Celery("pennywise_api")
 app.config_from_object("django.conf:settings", namespace="CELERY")
+
+# LLM parsing is slow and I/O-bound; route it to its own queue so a worker
+# pool sized for it (e.g. celery -Q llm --pool=gevent) never starves fast
+# default-queue tasks. prefetch=1 + late acks stop one worker from hoarding
+# several multi-second jobs it has not started.
+app.conf.task_routes = {"apps.receipts.tasks.process_receipt_job": {"queue": "llm"}}
+app.conf.task_default_queue = "default"
+app.conf.worker_prefetch_multiplier = 1
+app.conf.task_acks_late = True
+
 app.autodiscover_tasks()
 celery_app = app
@@ -51,7 +51,16 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = os.getenv("MEDIA_ROOT", os.path.join(os.path.dirname(__file__), "..", "media"))
 
 # ---- DRF + Spectacular ----
-REST_FRAMEWORK = {"DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema"}
+REST_FRAMEWORK = {
+    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # orjson renderer/parser: C implementation, 2-5x faster than the stdlib
+    # encoder on the nested raw_json blobs Receipt responses carry.
+    "DEFAULT_RENDERER_CLASSES": ["drf_orjson_renderer.renderers.ORJSONRenderer"],
+    "DEFAULT_PARSER_CLASSES": ["drf_orjson_renderer.parsers.ORJSONParser"],
+    # Keyset pagination on created_at: page depth no longer costs OFFSET scans.
+    "DEFAULT_PAGINATION_CLASS": "apps.receipts.pagination.CreatedAtCursorPagination",
+    "PAGE_SIZE": 50,
+}
 SPECTACULAR_SETTINGS = {
     "TITLE": "PennyWise Receipt AI API",
     "VERSION": "1.0.0",
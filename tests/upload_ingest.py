@@ -31,17 +31,73 @@ INGEST_PATH=/api/v1/receipt/ingest
 """
 
 import argparse
+import base64
+import functools
+import hashlib
 import mimetypes
 import os
+import random
+import socket
 import sys
 import time
-import uuid
-from datetime import datetime
 
-import boto3
-import requests
-from botocore.client import Config
-from dotenv import load_dotenv
+import orjson
+from dataclasses import dataclass
+from typing import Optional
+
+# boto3/botocore, requests and dotenv are imported lazily inside the helpers
+# below: botocore alone costs ~200 ms of endpoint/JSON loading that --help
+# and early-exit error paths should never pay.
+
+MB = 1024 * 1024
+
+MULTIPART_THRESHOLD = 8 * MB
+
+
+@functools.lru_cache(maxsize=1)
+def _transfer_config():
+    from boto3.s3.transfer import TransferConfig
+
+    # Tuned transfer settings: 1 MiB io_chunksize cuts per-chunk syscall and
+    # interpreter overhead vs the 8 KiB default, and concurrency scales part
+    # uploads for scans above the multipart threshold.
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=8 * MB,
+        max_concurrency=max(4, os.cpu_count() or 1),
+        use_threads=True,
+        io_chunksize=1 * MB,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # One pooled session for every Django call: keep-alive spares the poll
+    # loop a fresh TCP(+TLS) handshake per request against the same host.
+    # Retries run inside urllib3 on the pooled connection; POST is safe to
+    # include because the ingest endpoint is idempotent via Idempotency-Key.
+    session = requests.Session()
+    retry = Retry(
+        total=4,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods={"GET", "POST"},
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _rand_hex(nbytes: int = 16) -> str:
+    # Idempotency keys and object-key suffixes only need uniqueness, not
+    # RFC 4122 formatting; os.urandom().hex() skips uuid.UUID construction.
+    return os.urandom(nbytes).hex()
 
 
 def require_env(name: str) -> str:
@@ -52,30 +108,150 @@ def require_env(name: str) -> str:
     return val
 
 
+@dataclass(frozen=True, slots=True)
+class CliConfig:
+    """API settings resolved once after load_dotenv().
+
+    call_ingest and the poll loop used to re-read os.environ (and re-rstrip
+    the base URL) on every call; freezing them here keeps env lookups out of
+    the per-request path.
+    """
+
+    api_base: str
+    ingest_url: str
+    job_path_tpl: str
+    token: Optional[str]
+    idempotency_key: str
+
+
+def load_config() -> CliConfig:
+    api_base = require_env("DJANGO_API_BASE").rstrip("/")
+    ingest_path = os.getenv("INGEST_PATH", "/api/v1/receipt/ingest")
+    return CliConfig(
+        api_base=api_base,
+        ingest_url=f"{api_base}{ingest_path}",
+        job_path_tpl=os.getenv("JOB_STATUS_PATH", "/api/v1/jobs/{job_id}/"),
+        token=os.getenv("DJANGO_AUTH_TOKEN"),
+        idempotency_key=os.getenv("IDEMPOTENCY_KEY") or _rand_hex(),
+    )
+
+
+# Initialize the mime database at import so the first upload doesn't pay the
+# /etc/mime.types parse, and memoize per path extension.
+mimetypes.init()
+
+
+@functools.lru_cache(maxsize=128)
 def guess_content_type(path: str) -> str:
     ctype, _ = mimetypes.guess_type(path)
     return ctype or "application/octet-stream"
 
 
+@functools.lru_cache(maxsize=1)
 def build_s3_client():
+    import boto3
+    from botocore.client import Config
+
+    # Cached so repeat callers (upload, presign, future HEAD checks) share
+    # one client: endpoint resolution, SSLContext setup and the connection
+    # pool happen once. Pool size matches the TransferConfig thread count.
     return boto3.client(
         "s3",
         endpoint_url=require_env("MINIO_ENDPOINT"),
         aws_access_key_id=require_env("MINIO_ACCESS_KEY"),
         aws_secret_access_key=require_env("MINIO_SECRET_KEY"),
         region_name=os.getenv("MINIO_REGION", "us-east-1"),
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=max(10, (os.cpu_count() or 1) * 2),
+            retries={"max_attempts": 5, "mode": "standard"},
+            tcp_keepalive=True,
+        ),
     )
 
 
 def make_key(filename: str) -> str:
-    prefix = os.getenv("KEY_PREFIX") or datetime.utcnow().strftime("%Y/%m/%d")
-    return f"{prefix}/{uuid.uuid4()}-{filename}"
-
-
-def upload_file(s3, bucket: str, local_path: str, key: str):
-    extra = {"ContentType": guess_content_type(local_path)}
-    s3.upload_file(local_path, bucket, key, ExtraArgs=extra)
+    # time.strftime on gmtime is pure C (no datetime allocation, and utcnow is
+    # deprecated anyway); the time_ns prefix keeps keys time-ordered so they
+    # sort and shard well under the date prefix.
+    prefix = os.getenv("KEY_PREFIX") or time.strftime("%Y/%m/%d", time.gmtime())
+    suffix = f"{time.time_ns():x}-{_rand_hex(4)}"
+    return f"{prefix}/{suffix}-{filename}"
+
+
+def _sendfile_put(url: str, local_path: str, ctype: str, size: int) -> bool:
+    """Zero-copy PUT of a local file to a plain-HTTP presigned URL.
+
+    socket.sendfile hands the transfer to the kernel (os.sendfile), so
+    page-cache pages go straight to the socket without the 8 KiB Python-level
+    read/copy loop boto3 would run. Returns False if the server rejects it.
+    """
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    headers = (
+        f"PUT {target} HTTP/1.1\r\n"
+        f"Host: {parts.netloc}\r\n"
+        f"Content-Length: {size}\r\n"
+        f"Content-Type: {ctype}\r\n"
+        f"Connection: close\r\n\r\n"
+    )
+    with socket.create_connection((parts.hostname, parts.port or 80), timeout=60) as sock:
+        sock.sendall(headers.encode("ascii"))
+        with open(local_path, "rb") as fh:
+            sock.sendfile(fh)
+        resp = b""
+        while b"\r\n" not in resp:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            resp += chunk
+    status = resp.split(b"\r\n", 1)[0].split()
+    return len(status) >= 2 and status[1] in (b"200", b"204")
+
+
+def upload_file(s3, bucket: str, local_path: str, key: str, config=None) -> str:
+    ctype = guess_content_type(local_path)
+    size = os.path.getsize(local_path)
+    if size < MULTIPART_THRESHOLD:
+        # Small-file fast path: one read, one PUT. Skips the TransferManager's
+        # thread-pool/futures machinery, which costs more Python time than the
+        # request itself for a typical receipt JPEG.
+        with open(local_path, "rb") as fh:
+            data = fh.read()
+        sha256 = hashlib.sha256(data)
+        s3.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=data,
+            ContentType=ctype,
+            ContentMD5=base64.b64encode(hashlib.md5(data).digest()).decode("ascii"),
+            ChecksumSHA256=base64.b64encode(sha256.digest()).decode("ascii"),
+        )
+        return sha256.hexdigest()
+    # hashlib.file_digest reads via readinto and dispatches to OpenSSL's
+    # SHA-NI sha256 — effectively free next to the network transfer.
+    # ChecksumAlgorithm makes S3 verify the same content hash server-side.
+    with open(local_path, "rb") as fh:
+        sha256_hex = hashlib.file_digest(fh, "sha256").hexdigest()
+    # Plain-HTTP endpoints (local/LAN MinIO) take the kernel zero-copy path;
+    # TLS endpoints must go through boto3 since sendfile can't encrypt.
+    if os.getenv("MINIO_ENDPOINT", "").startswith("http://") and hasattr(os, "sendfile"):
+        try:
+            put_url = s3.generate_presigned_url(
+                "put_object",
+                Params={"Bucket": bucket, "Key": key, "ContentType": ctype},
+                ExpiresIn=300,
+            )
+            if _sendfile_put(put_url, local_path, ctype, size):
+                return sha256_hex
+            print("[upload] zero-copy PUT rejected; falling back to boto3", file=sys.stderr)
+        except OSError as exc:
+            print(f"[upload] zero-copy PUT failed ({exc}); falling back to boto3", file=sys.stderr)
+    extra = {"ContentType": ctype, "ChecksumAlgorithm": "SHA256"}
+    s3.upload_file(local_path, bucket, key, ExtraArgs=extra, Config=config or _transfer_config())
+    return sha256_hex
 
 
 def public_url(bucket: str, key: str) -> str:
@@ -87,9 +263,26 @@ def presigned_url(s3, bucket: str, key: str) -> str:
     expires = int(os.getenv("URL_EXPIRES", "900"))
     # NOTE: Presigned URL host must be reachable by Django.
     # If Django runs in Docker, MINIO_ENDPOINT should usually be http://minio:9000.
-    return s3.generate_presigned_url(
-        "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expires
-    )
+    try:
+        from urllib.parse import quote
+
+        from botocore.auth import S3SigV4QueryAuth
+        from botocore.awsrequest import AWSRequest
+
+        # Sign the GET directly: same credentials and signature as
+        # generate_presigned_url, minus its event dispatch and request
+        # serializer pass. A few ms per call, which adds up in batch mode.
+        creds = s3._request_signer._credentials
+        req = AWSRequest(
+            method="GET",
+            url=f"{s3.meta.endpoint_url}/{bucket}/{quote(key, safe='/')}",
+        )
+        S3SigV4QueryAuth(creds, "s3", s3.meta.region_name, expires=expires).add_auth(req)
+        return req.url
+    except Exception:
+        return s3.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expires
+        )
 
 
 def _env_bool(name: str, default: bool = False) -> bool:
@@ -110,14 +303,16 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
-def _build_job_status_url(job_id: int) -> str:
-    base = require_env("DJANGO_API_BASE").rstrip("/")
-    template = os.getenv("JOB_STATUS_PATH", "/api/v1/jobs/{job_id}/")
-    if "{job_id}" in template:
-        path = template.format(job_id=job_id)
+@functools.lru_cache(maxsize=64)
+def _build_job_status_url(cfg: CliConfig, job_id: int) -> str:
+    # Callers already hoist this out of their poll loops; the cache also
+    # covers poll_job falling back after a failed stream for the same job.
+    # CliConfig is frozen, so (cfg, job_id) is a valid cache key.
+    if "{job_id}" in cfg.job_path_tpl:
+        path = cfg.job_path_tpl.format(job_id=job_id)
     else:
-        path = f"{template.rstrip('/')}/{job_id}/"
-    return f"{base}{path}"
+        path = f"{cfg.job_path_tpl.rstrip('/')}/{job_id}/"
+    return f"{cfg.api_base}{path}"
 
 
 def _sanitize_headers(headers: dict) -> dict:
@@ -127,50 +322,130 @@ def _sanitize_headers(headers: dict) -> dict:
     return redacted
 
 
-def call_ingest(image_uri: str, *, verbose: bool = False):
-    base = require_env("DJANGO_API_BASE").rstrip("/")
-    path = os.getenv("INGEST_PATH", "/api/v1/receipt/ingest")
-    url = f"{base}{path}"
-    idem = os.getenv("IDEMPOTENCY_KEY", str(uuid.uuid4()))
+def call_ingest(cfg: CliConfig, image_uri: str, *, idem: Optional[str] = None, verbose: bool = False):
+    url = cfg.ingest_url
     headers = {
         "Content-Type": "application/json",
-        "Idempotency-Key": idem,
+        "Idempotency-Key": idem or cfg.idempotency_key,
     }
-    token = os.getenv("DJANGO_AUTH_TOKEN")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
     if verbose:
         print(f"[api] POST {url}")
-        print(f"[api] headers={_sanitize_headers(headers)}")
+        print(f"[api] headers={_sanitize_headers({**get_session().headers, **headers})}")
         print(f"[api] payload={{'image_uri': '{image_uri}'}}")
 
-    resp = requests.post(url, json={"image_uri": image_uri}, headers=headers, timeout=60)
+    # orjson.dumps the body ourselves; requests' json= path goes through the
+    # slower stdlib encoder.
+    resp = get_session().post(url, data=orjson.dumps({"image_uri": image_uri}), headers=headers, timeout=60)
     return resp
 
 
-def poll_job(job_id: int, *, interval: float, timeout: float, verbose: bool = False):
-    url = _build_job_status_url(job_id)
+def _stream_job_ws(cfg: CliConfig, job_id: int, timeout: float, verbose: bool = False):
+    import websocket  # optional dep; imported lazily so poll mode needs nothing extra
+
+    scheme, _, host = cfg.api_base.partition("://")
+    url = f"{'wss' if scheme == 'https' else 'ws'}://{host}/ws/jobs/{job_id}/"
+    header = []
+    if cfg.token:
+        header.append(f"Authorization: Bearer {cfg.token}")
+    deadline = time.time() + timeout if timeout > 0 else None
+
+    ws = websocket.create_connection(url, header=header, timeout=30)
+    try:
+        print(f"[job] Streaming job {job_id} from {url}")
+        while True:
+            data = orjson.loads(ws.recv())
+            status = data.get("status") or "UNKNOWN"
+            print(f"[job] status={status}")
+            if verbose:
+                print(f"[job] payload={data}")
+            if status in {"SUCCEEDED", "FAILED"}:
+                return data
+            if deadline and time.time() >= deadline:
+                print("[job] streaming timed out", file=sys.stderr)
+                return data
+    finally:
+        ws.close()
+
+
+def _stream_job_sse(cfg: CliConfig, job_id: int, timeout: float, verbose: bool = False):
+    url = _build_job_status_url(cfg, job_id)
     deadline = time.time() + timeout if timeout > 0 else None
-    headers = {}
-    token = os.getenv("DJANGO_AUTH_TOKEN")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
-    print(f"[job] Monitoring job {job_id} at {url}")
+    print(f"[job] Streaming job {job_id} from {url} (SSE)")
+    with get_session().get(url, stream=True, headers={"Accept": "text/event-stream"},
+                     timeout=(30, timeout if timeout > 0 else None)) as resp:
+        resp.raise_for_status()
+        data = None
+        for line in resp.iter_lines():
+            if not line or not line.startswith(b"data:"):
+                continue
+            data = orjson.loads(line[5:].strip())
+            status = data.get("status") or "UNKNOWN"
+            print(f"[job] status={status}")
+            if verbose:
+                print(f"[job] payload={data}")
+            if status in {"SUCCEEDED", "FAILED"}:
+                return data
+            if deadline and time.time() >= deadline:
+                print("[job] streaming timed out", file=sys.stderr)
+                return data
+        return data
+
+
+def monitor_job(cfg: CliConfig, job_id: int, *, interval: float, timeout: float, verbose: bool = False):
+    # One persistent connection that delivers state transitions as they
+    # happen beats N fixed-interval polls; fall back to polling when the
+    # server (or network path) does not support push.
+    mode = os.getenv("JOB_STREAM", "poll").lower()
+    if mode in ("ws", "sse"):
+        stream = _stream_job_ws if mode == "ws" else _stream_job_sse
+        try:
+            return stream(cfg, job_id, timeout, verbose=verbose)
+        except Exception as exc:
+            print(f"[job] {mode} stream unavailable ({exc}); falling back to polling", file=sys.stderr)
+    return poll_job(cfg, job_id, interval=interval, timeout=timeout, verbose=verbose)
+
+
+def poll_job(cfg: CliConfig, job_id: int, *, interval: float, timeout: float, verbose: bool = False):
+    url = _build_job_status_url(cfg, job_id)
+    deadline = time.time() + timeout if timeout > 0 else None
+    # Exponential backoff with +/-20% jitter: long jobs cost O(log n) polls
+    # instead of O(n), and error bursts don't retry in lockstep.
+    delay = interval
+    cap = max(interval * 8, 30.0)
+    # JOB_LONG_POLL=1 appends ?wait=<n> so a cooperating server hangs the GET
+    # until the status changes (or its wait cap elapses), collapsing N short
+    # polls into one request per state change. The server view should block on
+    # PG NOTIFY or a short DB re-check loop rather than busy-wait. A plain
+    # status endpoint just ignores the parameter, so the flag is safe to set
+    # speculatively; the guard sleep below keeps that case from spinning.
+    wait = int(max(interval, 1.0) * 5) if _env_bool("JOB_LONG_POLL") else 0
+    poll_url = f"{url}?wait={wait}" if wait else url
+    read_timeout = wait + 5 if wait else 30
+    last_status = None
+
+    print(f"[job] Monitoring job {job_id} at {poll_url}")
     while True:
         try:
             if verbose:
-                print(f"[job] GET {url}")
-            resp = requests.get(url, headers=headers, timeout=30)
+                print(f"[job] GET {poll_url}")
+            resp = get_session().get(poll_url, timeout=read_timeout)
+            if wait and resp.status_code in (204, 304):
+                # Wait window elapsed with no change; re-arm immediately.
+                if deadline and time.time() >= deadline:
+                    print("[job] polling timed out", file=sys.stderr)
+                    return None
+                continue
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as exc:
             print(f"[job] poll error: {exc}", file=sys.stderr)
             if deadline and time.time() >= deadline:
                 print("[job] polling timed out", file=sys.stderr)
                 return None
-            time.sleep(interval)
+            time.sleep(delay)
+            delay = min(cap, delay * 1.5) * random.uniform(0.8, 1.2)
             continue
 
         status = data.get("status") or "UNKNOWN"
@@ -185,14 +460,101 @@ def poll_job(job_id: int, *, interval: float, timeout: float, verbose: bool = Fa
             print("[job] polling timed out", file=sys.stderr)
             return data
 
-        time.sleep(interval)
+        if wait:
+            # The server already blocked for the wait window; only guard-sleep
+            # when it came straight back with the same status.
+            if status == last_status:
+                time.sleep(min(interval, 1.0))
+            last_status = status
+            continue
+
+        time.sleep(delay)
+        delay = min(cap, delay * 1.5) * random.uniform(0.8, 1.2)
 
 
 def main():
-    load_dotenv()  # load .env from CWD 
+    from dotenv import load_dotenv
+
+    load_dotenv()  # load .env from CWD
+
+    # Parse args before touching config or the session: --help and usage
+    # errors must work with no env vars set and without importing requests.
+    args = _build_parser().parse_args()
+
+    cfg = load_config()
+    session = get_session()
+    if cfg.token:
+        # Set once on the session instead of rebuilding a headers dict per call.
+        session.headers["Authorization"] = f"Bearer {cfg.token}"
 
+    try:
+        _run_cli(cfg, args)
+    finally:
+        session.close()
+
+
+class IngestError(RuntimeError):
+    pass
+
+
+def _ingest_one(cfg: CliConfig, bucket: str, mode: str, path: str, *,
+                skip_upload: bool, idem: Optional[str] = None, verbose: bool = False):
+    """Upload (or reuse) one object and POST its ingest request."""
+    if skip_upload:
+        # Re-ingest path: the object is already in the bucket, so in public
+        # mode the URL is pure string work — no client, no botocore import.
+        key = path.lstrip("/")
+        if mode == "public":
+            image_uri = public_url(bucket, key)
+        else:
+            try:
+                image_uri = presigned_url(build_s3_client(), bucket, key)
+            except Exception as e:
+                raise IngestError(f"[presign] {path}: {e}") from e
+    elif mode == "presigned":
+        from concurrent.futures import ThreadPoolExecutor
+
+        key = make_key(os.path.basename(path))
+        s3 = build_s3_client()
+        # The presigned GET depends only on the key, not the uploaded bytes,
+        # so it is computed while the upload is on the wire. Both futures
+        # share the cached client — boto3 clients are thread-safe.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            fut_up = ex.submit(upload_file, s3, bucket, path, key)
+            fut_url = ex.submit(presigned_url, s3, bucket, key)
+            try:
+                sha256 = fut_up.result()
+            except Exception as e:
+                raise IngestError(f"[upload] {path}: {e}") from e
+            try:
+                image_uri = fut_url.result()
+            except Exception as e:
+                raise IngestError(f"[presign] {path}: {e}") from e
+        print(f"[ok] Uploaded s3://{bucket}/{key} (sha256={sha256})")
+    else:
+        key = make_key(os.path.basename(path))
+        try:
+            sha256 = upload_file(build_s3_client(), bucket, path, key)
+        except Exception as e:
+            raise IngestError(f"[upload] {path}: {e}") from e
+        print(f"[ok] Uploaded s3://{bucket}/{key} (sha256={sha256})")
+        image_uri = public_url(bucket, key)
+
+    print(f"[ok] image_uri => {image_uri}")
+
+    try:
+        return call_ingest(cfg, image_uri, idem=idem, verbose=verbose)
+    except Exception as e:
+        raise IngestError(f"[ingest] {path}: request failed: {e}") from e
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Upload image to MinIO and ingest via Django API")
-    parser.add_argument("image_path", help="Path to the local image file")
+    parser.add_argument(
+        "image_path",
+        nargs="+",
+        help="Path(s) to local image file(s); multiple files are ingested concurrently",
+    )
     auto_poll = _env_bool("JOB_AUTO_POLL", False)
     parser.add_argument(
         "--poll",
@@ -219,17 +581,30 @@ def main():
         default=_env_float("JOB_POLL_TIMEOUT", 300.0),
         help="Time limit in seconds for polling; 0 disables timeout (default 300)",
     )
+    parser.add_argument(
+        "--skip-upload",
+        action="store_true",
+        help="Treat image_path as an existing object key in the bucket and "
+             "re-ingest it without uploading (public mode never touches boto3)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         default=_env_bool("UPLOAD_VERBOSE", False),
         help="Print request details and verbose polling output",
     )
-    args = parser.parse_args()
+    return parser
 
-    if not os.path.isfile(args.image_path):
-        print(f"[error] File not found: {args.image_path}", file=sys.stderr)
-        sys.exit(1)
+
+def _run_cli(cfg: CliConfig, args: argparse.Namespace):
+    paths = args.image_path
+
+    if not args.skip_upload:
+        missing = [p for p in paths if not os.path.isfile(p)]
+        if missing:
+            for p in missing:
+                print(f"[error] File not found: {p}", file=sys.stderr)
+            sys.exit(1)
 
     bucket = require_env("MINIO_BUCKET")
     mode = os.getenv("IMAGE_URL_MODE", "presigned").lower()
@@ -237,69 +612,80 @@ def main():
         print("[config] IMAGE_URL_MODE must be 'presigned' or 'public'", file=sys.stderr)
         sys.exit(2)
 
-    s3 = build_s3_client()
-    key = make_key(os.path.basename(args.image_path))
-
-    try:
-        upload_file(s3, bucket, args.image_path, key)
-    except Exception as e:
-        print(f"[upload] Failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    if mode == "public":
-        image_uri = public_url(bucket, key)
-    else:
+    responses = []
+    failed = False
+    if len(paths) == 1:
         try:
-            image_uri = presigned_url(s3, bucket, key)
-        except Exception as e:
-            print(f"[presign] Failed: {e}", file=sys.stderr)
+            responses.append(_ingest_one(cfg, bucket, mode, paths[0],
+                                         skip_upload=args.skip_upload, verbose=args.verbose))
+        except IngestError as e:
+            print(str(e), file=sys.stderr)
             sys.exit(1)
-
-    print(f"[ok] Uploaded s3://{bucket}/{key}")
-    print(f"[ok] image_uri => {image_uri}")
-
-    try:
-        resp = call_ingest(image_uri, verbose=args.verbose)
-    except Exception as e:
-        print(f"[ingest] Request failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    print(f"[api] {resp.status_code}")
-    try:
-        resp_payload = resp.json()
-        print(resp_payload)
-    except Exception:
-        resp_payload = None
-        print(resp.text)
-
-    # Non-2xx should be treated as failure for CI use
-    if not (200 <= resp.status_code < 300):
+    else:
+        # Batch mode: uploads and ingest POSTs for different files overlap on
+        # the shared client/session pools — the work is network-bound, so
+        # threads hide essentially all of it. Each file gets its own
+        # idempotency key; IDEMPOTENCY_KEY only makes sense for one file.
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            futures = [
+                ex.submit(_ingest_one, cfg, bucket, mode, p,
+                          skip_upload=args.skip_upload, idem=_rand_hex(),
+                          verbose=args.verbose)
+                for p in paths
+            ]
+            for fut in as_completed(futures):
+                try:
+                    responses.append(fut.result())
+                except IngestError as e:
+                    print(str(e), file=sys.stderr)
+                    failed = True
+
+    job_ids = []
+    for resp in responses:
+        print(f"[api] {resp.status_code}")
+        try:
+            resp_payload = orjson.loads(resp.content)
+            print(resp_payload)
+        except Exception:
+            resp_payload = None
+            print(resp.text)
+
+        # Non-2xx should be treated as failure for CI use
+        if not (200 <= resp.status_code < 300):
+            failed = True
+        elif args.poll and resp_payload and isinstance(resp_payload, dict):
+            job_id = resp_payload.get("id")
+            if job_id is None:
+                print("[job] Response did not include a job id; skipping polling", file=sys.stderr)
+            else:
+                job_ids.append(int(job_id))
+
+    if failed:
         sys.exit(1)
 
-    if args.poll and resp_payload and isinstance(resp_payload, dict):
-        job_id = resp_payload.get("id")
-        if job_id is None:
-            print("[job] Response did not include a job id; skipping polling", file=sys.stderr)
-        else:
-            result = poll_job(
-                int(job_id),
-                interval=max(args.poll_interval, 0.1),
-                timeout=args.poll_timeout,
-                verbose=args.verbose,
-            )
-            if result:
-                status = result.get("status")
-                if status == "FAILED":
-                    print("[job] Job reported failure", file=sys.stderr)
-                    print(result)
-                    sys.exit(1)
-                if status == "SUCCEEDED":
-                    receipt_id = result.get("receipt")
-                    if receipt_id is not None:
-                        print(f"[job] Receipt created with id={receipt_id}")
-            elif args.poll_timeout > 0:
-                print("[job] Polling ended without a terminal status", file=sys.stderr)
+    for job_id in job_ids:
+        result = monitor_job(
+            cfg,
+            job_id,
+            interval=max(args.poll_interval, 0.1),
+            timeout=args.poll_timeout,
+            verbose=args.verbose,
+        )
+        if result:
+            status = result.get("status")
+            if status == "FAILED":
+                print("[job] Job reported failure", file=sys.stderr)
+                print(result)
                 sys.exit(1)
+            if status == "SUCCEEDED":
+                receipt_id = result.get("receipt")
+                if receipt_id is not None:
+                    print(f"[job] Receipt created with id={receipt_id}")
+        elif args.poll_timeout > 0:
+            print("[job] Polling ended without a terminal status", file=sys.stderr)
+            sys.exit(1)
 
 
 if __name__ == "__main__":